@@ -0,0 +1,289 @@
+import io
+import mmap
+import os
+import re
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import streamlit as st
+from streamlit_autorefresh import st_autorefresh
+
+DATA_FILE = "data.csv"
+COLS = ["timestamp", "rating", "review", "summary", "actions"]
+
+ADMIN_USER = os.getenv("ADMIN_USER", "admin")
+ADMIN_PASS = os.getenv("ADMIN_PASS", "admin123")
+
+# small immutable lexicons for the quick sentiment KPI, built once at import
+POS = frozenset({
+    "good", "great", "excellent", "amazing", "awesome", "love", "loved",
+    "nice", "helpful", "fast", "perfect", "happy", "best", "easy",
+})
+NEG = frozenset({
+    "bad", "terrible", "awful", "horrible", "hate", "hated", "slow",
+    "worst", "broken", "bug", "crash", "useless", "poor", "confusing",
+})
+
+# compiled once at import so the KPI block never rebuilds them per rerun
+POS_RE = re.compile(r"\b(" + "|".join(sorted(POS)) + r")\b")
+NEG_RE = re.compile(r"\b(" + "|".join(sorted(NEG)) + r")\b")
+
+# single-pass multi-keyword scan: one automaton walk per blob replaces one
+# regex alternation pass per lexicon (pyahocorasick is optional on the host,
+# the regex path below stays as the fallback)
+try:
+    import ahocorasick
+
+    _AUTOMATON = ahocorasick.Automaton()
+    for _w in POS:
+        _AUTOMATON.add_word(_w, (len(_w), 1))
+    for _w in NEG:
+        _AUTOMATON.add_word(_w, (len(_w), -1))
+    _AUTOMATON.make_automaton()
+except ImportError:
+    _AUTOMATON = None
+
+
+def _score_blob(s):
+    # the automaton matches substrings ("bad" in "badge"), so accept a hit
+    # only at word boundaries — keeps this path scoring identically to the
+    # \b-anchored regex fallback
+    low = s.lower()
+    total = 0
+    for end, (wlen, val) in _AUTOMATON.iter(low):
+        start = end - wlen + 1
+        if start > 0 and low[start - 1].isalnum():
+            continue
+        if end + 1 < len(low) and low[end + 1].isalnum():
+            continue
+        total += val
+    return total / (len(s.split()) or 1)
+
+st.set_page_config(page_title="Admin Dashboard", page_icon="📊", layout="wide")
+
+
+def check_login():
+    if st.session_state.get("logged_in"):
+        return True
+    st.title("🔐 Admin Login")
+    with st.form("login_form"):
+        user = st.text_input("Username")
+        pwd = st.text_input("Password", type="password")
+        submitted = st.form_submit_button("Login")
+    if submitted:
+        if user == ADMIN_USER and pwd == ADMIN_PASS:
+            st.session_state["logged_in"] = True
+            st.rerun()
+        else:
+            st.error("Invalid username or password")
+    return False
+
+
+@st.cache_data(show_spinner=False)
+def load_data(path=DATA_FILE, mtime=0.0):
+    # mtime is only part of the cache key: the file is re-read exactly when it
+    # changes on disk, instead of every few seconds on a TTL
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=COLS)
+    # sibling parquet cache: columnar reads are several times faster than
+    # re-parsing CSV, so the CSV is only parsed when it has newer data
+    pq_path = os.path.splitext(path)[0] + ".parquet"
+    if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= mtime:
+        return pd.read_parquet(pq_path, columns=COLS, dtype_backend="pyarrow")
+    # pyarrow's multi-threaded reader with a fixed schema skips pandas' type
+    # inference and gives Arrow-backed string columns for the str ops below
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(
+            # parse only the columns the dashboard uses, whatever else the
+            # writer may add to the file later
+            include_columns=COLS,
+            column_types={
+                "rating": pa.int8(),
+                "review": pa.string(),
+                "summary": pa.string(),
+                "actions": pa.string(),
+                "timestamp": pa.string(),
+            }
+        ),
+    )
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    try:
+        df.to_parquet(pq_path, compression="zstd")
+    except OSError:
+        pass  # read-only filesystem: just serve the CSV parse
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def read_tail(path=DATA_FILE, n=50, mtime=0.0):
+    """Read just the last n CSV rows by scanning the mmapped file backwards.
+
+    Keeps the "latest" KPI constant-time as data.csv grows; the full frame
+    stays behind the lazier load_data cache. The public app writes reviews
+    with newlines collapsed, so line boundaries are row boundaries here.
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=COLS)
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            end = mm.size()
+            i = end
+            newlines = 0
+            while newlines <= n and i > 0:
+                j = mm.rfind(b"\n", 0, i)
+                if j < 0:
+                    i = 0
+                    break
+                i = j
+                newlines += 1
+            tail = mm[i + 1 if i else 0 : end].decode("utf-8", "replace")
+        finally:
+            mm.close()
+    df = pd.read_csv(io.StringIO(tail), names=COLS, header=None)
+    # if the file is short the header line is still in the window; drop it
+    df = df[df["timestamp"] != "timestamp"]
+    # match load_data: Arrow-backed strings so str ops stay in C kernels
+    for c in ("timestamp", "review", "summary", "actions"):
+        df[c] = df[c].astype("string[pyarrow]")
+    return df
+
+
+# cheap DataFrame fingerprint for cache keys: row count + newest raw timestamp
+# changes whenever the underlying CSV gains rows, without hashing every cell
+_DF_HASH = {pd.DataFrame: lambda d: (len(d), d["timestamp"].iloc[-1] if len(d) else "")}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def parse_timestamps(df):
+    # the public app writes ISO-8601, so an explicit format keeps parsing on
+    # the C fast path instead of per-row dateutil inference
+    df["ts_parsed"] = pd.to_datetime(
+        df["timestamp"], format="ISO8601", utc=True, errors="coerce", cache=True
+    )
+    return df
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def apply_filters(df, date_range, ratings, query):
+    # AND every condition into one mask and slice once, instead of
+    # materializing an intermediate frame per filter
+    mask = pd.Series(True, index=df.index)
+    if ratings:
+        mask &= df["rating"].isin(ratings)
+    if len(date_range) == 2:
+        start_dt = pd.Timestamp(date_range[0], tz="UTC")
+        end_dt = pd.Timestamp(date_range[1], tz="UTC") + pd.Timedelta(days=1)
+        mask &= (df["ts_parsed"] >= start_dt) & (df["ts_parsed"] < end_dt)
+    if query:
+        # one pass over a single combined column instead of three lowered copies;
+        # \x1f can never appear in a typed query, so no false matches across fields
+        combined = (
+            df["review"].fillna("") + "\x1f" + df["summary"].fillna("") + "\x1f" + df["actions"].fillna("")
+        )
+        mask &= combined.str.contains(query, case=False, regex=False, na=False)
+    return df.loc[mask]
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def compute_trend(df, date_range=(), ratings=(), query=""):
+    # the filter arguments only widen the cache key: the frame fingerprint
+    # alone (row count + newest row) can collide across filter settings
+    # pd.Grouper buckets on the underlying int64 datetime values in C instead
+    # of materializing and hashing a column of Python date objects
+    return df.groupby(pd.Grouper(key="ts_parsed", freq="D"))["rating"].mean().dropna()
+
+
+def main():
+    if not check_login():
+        return
+
+    st_autorefresh(interval=5000, key="refresh")
+
+    st.title("📊 Feedback Admin Dashboard")
+
+    mtime = os.path.getmtime(DATA_FILE) if os.path.exists(DATA_FILE) else 0.0
+    # tied to data mtime, not wall clock: unchanged data renders an identical
+    # metric so Streamlit can skip the delta on no-op refreshes
+    last_ref = (
+        datetime.utcfromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S") if mtime else "—"
+    )
+    st.metric("Last data update (UTC)", last_ref)
+    df_raw = load_data(DATA_FILE, mtime)
+    if df_raw.empty:
+        # nothing to analyze: skip the whole filter/KPI/chart pipeline
+        st.info("No feedback submitted yet.")
+        st.stop()
+    df_raw = parse_timestamps(df_raw)
+
+    # ---- sidebar filters ----
+    st.sidebar.header("Filters")
+    # ratings are a closed 1-5 set; hard-coding skips a full-column unique()
+    # scan per rerun and absent ratings simply match nothing in the filter
+    rating_options = [5, 4, 3, 2, 1]
+    selected_ratings = st.sidebar.multiselect("Ratings", rating_options, default=rating_options)
+    default_start = datetime.utcnow().date() - timedelta(days=30)
+    date_range = st.sidebar.date_input("Date range", (default_start, datetime.utcnow().date()))
+    q = st.sidebar.text_input("Search text").strip().lower()
+
+    df = apply_filters(df_raw, tuple(date_range), tuple(selected_ratings), q)
+
+    # ---- KPI cards ----
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Total submissions", len(df))
+    c2.metric("Average rating", f"{df['rating'].mean():.2f}" if not df.empty else "—")
+    tail = read_tail(DATA_FILE, 50, mtime)
+    c4.metric("Latest submission", str(tail["timestamp"].iloc[-1]) if not tail.empty else "—")
+
+    if not df.empty:
+        # columns come out of load_data Arrow-backed, so the concatenation is
+        # already an Arrow string column — no per-rerun astype needed
+        text_blob = (
+            df["review"].fillna("") + " " + df["summary"].fillna("") + " " + df["actions"].fillna("")
+        )
+        if _AUTOMATON is not None:
+            df["sent_score"] = [_score_blob(x) for x in text_blob.tolist()]
+        else:
+            low = text_blob.str.lower()
+            pos = low.str.count(POS_RE.pattern)
+            neg = low.str.count(NEG_RE.pattern)
+            wc = text_blob.str.split().str.len().clip(lower=1)
+            df["sent_score"] = ((pos - neg) / wc).astype(float)
+        c3.metric("Avg sentiment", f"{df['sent_score'].mean():+.3f}")
+    else:
+        df["sent_score"] = pd.Series(dtype=float)
+        c3.metric("Avg sentiment", "—")
+
+    # ---- rating trend ----
+    st.subheader("Rating trend")
+    if not df.empty:
+        st.line_chart(compute_trend(df, tuple(date_range), tuple(selected_ratings), q))
+    else:
+        st.info("No data for the selected filters yet.")
+
+    # ---- recent submissions ----
+    st.subheader("Recent submissions")
+    if not df.empty:
+        # one Arrow-serialized table to the browser instead of 50 expanders
+        # each pushing several markdown deltas over the websocket
+        # nlargest is O(N log 50) vs a full O(N log N) sort just to take 50 rows
+        subset = df.nlargest(50, "ts_parsed")[
+            ["timestamp", "rating", "review", "summary", "actions", "sent_score"]
+        ]
+        st.dataframe(
+            subset,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "rating": st.column_config.NumberColumn("rating", format="%d ★"),
+                "sent_score": st.column_config.NumberColumn("sentiment", format="%+.3f"),
+            },
+        )
+    else:
+        st.info("Nothing to show yet.")
+
+
+main()
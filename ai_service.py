@@ -0,0 +1,94 @@
+import functools
+import json
+import os
+
+import google.generativeai as genai
+
+MODEL = "models/gemini-2.5-flash"
+API_KEY = os.getenv("GEMINI_API_KEY", "")
+
+if API_KEY:
+    genai.configure(api_key=API_KEY)
+
+_MODEL_INSTANCE = None
+
+# ask Gemini for bare JSON so the reply parses with json.loads instead of
+# eval() over raw model text (which was both unsafe and slower)
+GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "object",
+        "properties": {
+            "response": {"type": "string"},
+            "summary": {"type": "string"},
+            "actions": {"type": "string"},
+        },
+        "required": ["response", "summary", "actions"],
+    },
+}
+
+
+class AIServiceError(Exception):
+    """Raised when a genuine model response could not be produced."""
+
+
+def is_real_client_available():
+    """True when a Gemini API key is configured for this process."""
+    return bool(API_KEY)
+
+
+def _build_prompt(review, rating):
+    return f"""
+A user submitted feedback with a {rating}/5 star rating.
+
+Review: "{review}"
+
+Return ONLY valid JSON with these keys:
+{{
+  "response": "<a short friendly reply to the user>",
+  "summary": "<one-line summary of the feedback>",
+  "actions": "<suggested follow-up actions for the team>"
+}}
+"""
+
+
+def fallback_feedback(review, rating):
+    """Canned reply for when no model response is available; never cache it."""
+    return {
+        "response": "Thank you for your feedback!",
+        "summary": f"{rating}/5 rating: {review[:80]}",
+        "actions": "Review manually (AI unavailable).",
+    }
+
+
+def _get_model():
+    # build the client once per process instead of per call; lazy so that
+    # importing this module without an API key stays side-effect free
+    global _MODEL_INSTANCE
+    if _MODEL_INSTANCE is None:
+        _MODEL_INSTANCE = genai.GenerativeModel(MODEL, generation_config=GENERATION_CONFIG)
+    return _MODEL_INSTANCE
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_generate(review, rating):
+    # cache the raw JSON text (immutable) so repeat (review, rating) pairs
+    # never leave the process; callers parse their own copy
+    result = _get_model().generate_content(_build_prompt(review, rating))
+    return result.text
+
+
+def generate_ai_feedback(review, rating):
+    """Generate a structured {response, summary, actions} dict for a review.
+
+    Raises AIServiceError when no genuine model response is available —
+    missing key, API failure (quota, network, safety block) or malformed
+    reply. Callers build their own fallback so a transient failure is never
+    mistaken for real model output and persisted in a cache tier.
+    """
+    if not is_real_client_available():
+        raise AIServiceError("no API key configured")
+    try:
+        return json.loads(_cached_generate(review, rating))
+    except Exception as exc:
+        raise AIServiceError(str(exc)) from exc
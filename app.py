@@ -0,0 +1,201 @@
+import csv
+import hashlib
+import html
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from ai_service import (
+    AIServiceError,
+    fallback_feedback,
+    generate_ai_feedback,
+    is_real_client_available,
+)
+from db import (
+    DB_PATH,
+    fetch_recent_sql,
+    flush_writes,
+    init_db,
+    insert_feedback_sql,
+    lookup_llm_cache,
+    start_writer,
+    store_llm_cache,
+)
+from semantic_cache import SemanticCache
+
+DATA_CSV = "data.csv"
+
+st.set_page_config(page_title="Feedback", page_icon="💬")
+
+@st.cache_resource
+def _get_sem_cache():
+    # one instance per process, like db.get_conn(): the main script re-runs
+    # in a fresh namespace every rerun, and a per-rerun instance would reload
+    # the embedding model and re-SELECT the whole cache each time (its lock
+    # would also not be shared across sessions)
+    return SemanticCache(DB_PATH)
+
+
+_SEM_CACHE = _get_sem_cache()
+
+# every session shares this process: cap in-flight LLM calls so a burst of
+# submits can't fan out into dozens of blocking requests (cache hits never
+# acquire this); cached so all sessions contend on the same object instead
+# of a fresh semaphore per rerun
+@st.cache_resource
+def _get_llm_sem():
+    return threading.BoundedSemaphore(int(os.getenv("LLM_MAX_INFLIGHT", "4")))
+
+
+_LLM_SEM = _get_llm_sem()
+
+
+@st.cache_data(show_spinner=False)
+def load_css(path="style.css"):
+    with open(path, encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
+
+@st.cache_data(show_spinner=False, max_entries=1024)
+def _cached_ai(review, rating):
+    # free in-process LRU for same-session resubmits of the same pair;
+    # review is already whitespace-normalized by handle_submit. There is no
+    # TTL, so it matters that failures raise AIServiceError out of here:
+    # st.cache_data does not cache exceptions, and only genuine model
+    # responses may be pinned for the life of the process
+    return generate_ai_feedback(review, rating)
+
+
+def exact_cache_key(rating_val, review_text):
+    norm = " ".join(review_text.lower().split())
+    payload = json.dumps({"r": rating_val, "t": norm}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def append_csv(record):
+    # mirror every submission into data.csv for the admin dashboard;
+    # whitespace is collapsed in every text field (the LLM summary/actions
+    # can contain newlines too) so one CSV line is always one submission —
+    # the admin tail reader depends on that
+    with open(DATA_CSV, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(["timestamp", "rating", "review", "summary", "actions"])
+        writer.writerow(
+            [
+                record["timestamp"],
+                record["rating"],
+                " ".join(str(record["review"]).split()),
+                " ".join(str(record["summary"]).split()),
+                " ".join(str(record["actions"]).split()),
+            ]
+        )
+
+
+def handle_submit():
+    rating_val = st.session_state.get("rating_input", 3)
+    review_text = " ".join(st.session_state.get("review_input", "").split())
+    if not review_text:
+        st.session_state["last_error"] = "Please write a short review before submitting."
+        return
+    # cache tiers, cheapest first: an exact (rating, normalized review) hash
+    # hit costs one SELECT and skips even the embedding; then the semantic
+    # cache catches near-duplicates; only a full miss reaches the LLM
+    key = exact_cache_key(rating_val, review_text)
+    if (ai := lookup_llm_cache(key)) is not None:
+        pass
+    elif (hit := _SEM_CACHE.lookup(review_text)) is not None:
+        ai = hit
+        store_llm_cache(key, ai)
+    else:
+        # only genuine model output reaches the persistent tiers: any
+        # failure raises out of generate_ai_feedback, so one quota blip or
+        # network error can never poison the caches with the canned reply
+        try:
+            with st.spinner("Waiting for AI…"), _LLM_SEM:
+                ai = _cached_ai(review_text, rating_val)
+        except AIServiceError:
+            ai = fallback_feedback(review_text, rating_val)
+        else:
+            _SEM_CACHE.insert(review_text, ai)
+            store_llm_cache(key, ai)
+    record = {
+        "rating": rating_val,
+        "review": review_text,
+        "summary": ai.get("summary", ""),
+        "actions": ai.get("actions", ""),
+        # isoformat is a C fast path (no strftime format parsing) and sorts
+        # lexicographically, so ORDER BY timestamp stays correct as TEXT
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    insert_feedback_sql(record)
+    append_csv(record)
+    # only invalidate the recent-list cache once the row is committed;
+    # otherwise the rerun would cache a stale result under the new version.
+    # If the flush times out the 60s TTL picks the row up instead.
+    if flush_writes():
+        st.session_state["_feedback_version"] = st.session_state.get("_feedback_version", 0) + 1
+    st.session_state["last_ai"] = ai
+    st.session_state["last_error"] = ""
+
+
+init_db()
+start_writer()
+st.markdown(load_css(), unsafe_allow_html=True)
+
+st.markdown(
+    "# 💬 Share your feedback\n\n"
+    "Rate your experience and tell us what happened.\n\n"
+    "The AI reads every submission and suggests follow-up actions."
+)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _live_status():
+    # probing the AI client on every keystroke-triggered rerun is wasted
+    # work; a 30s-cached boolean is plenty fresh for a status badge
+    try:
+        return is_real_client_available()
+    except Exception:
+        return False
+
+
+live = _live_status()
+st.caption("AI status: " + ("🟢 live" if live else "⚪ offline (canned replies)"))
+
+with st.form("feedback_form"):
+    st.radio("Rating", [1, 2, 3, 4, 5], index=2, horizontal=True, key="rating_input")
+    st.text_area("Your review", key="review_input")
+    st.form_submit_button("Submit feedback", on_click=handle_submit)
+
+if st.session_state.get("last_error"):
+    st.error(st.session_state["last_error"])
+elif st.session_state.get("last_ai"):
+    ai = st.session_state["last_ai"]
+    st.success(ai.get("response", "Thank you for your feedback!"))
+    st.markdown(f"*Summary:* {ai.get('summary', '')}")
+    st.markdown(f"*Suggested actions:* {ai.get('actions', '')}")
+
+st.markdown("## Recent submissions")
+recent = fetch_recent_sql(limit=5, v=st.session_state.get("_feedback_version", 0))
+if not recent:
+    st.info("No feedback yet — be the first!")
+else:
+    # one markdown delta for the whole list instead of 4-5 per record;
+    # review/summary/actions are user- or LLM-supplied and rendered with
+    # unsafe_allow_html, so escape them to keep stored HTML from executing
+    parts = []
+    for rec in recent:
+        review = html.escape(rec["review"] or "")
+        summary = html.escape(rec["summary"] or "")
+        actions = html.escape(rec["actions"] or "")
+        parts.append(
+            f"**{rec['timestamp']}** — <span class='stars'>{'★' * int(rec['rating'])}</span>\n\n"
+            f"{review}\n\n"
+            + (f"*AI summary:* {summary}\n\n" if summary else "")
+            + (f"*AI actions:* {actions}\n\n" if actions else "")
+            + "---\n"
+        )
+    st.markdown("".join(parts), unsafe_allow_html=True)
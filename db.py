@@ -0,0 +1,151 @@
+"""SQLite persistence helpers shared by the feedback app."""
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+DB_PATH = "feedback.db"
+
+logger = logging.getLogger(__name__)
+
+# all sessions share one process, so one WAL connection serves them all;
+# writes serialize through this lock
+_WRITE_LOCK = threading.Lock()
+
+
+@st.cache_resource
+def get_conn():
+    # one connection per process: reopening the db (plus -wal/-shm) on every
+    # call cost three opens and pager setup per query
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")
+    return conn
+
+
+def init_db():
+    conn = get_conn()
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS feedback ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "rating INTEGER, review TEXT, summary TEXT, actions TEXT, timestamp TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "key TEXT PRIMARY KEY, response TEXT, summary TEXT, actions TEXT, created REAL)"
+    )
+    # covering index for fetch_recent_sql: the newest-N query is satisfied
+    # from the index B-tree alone instead of touching every row page
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_feedback_recent "
+        "ON feedback(id DESC, rating, timestamp, summary, actions, review)"
+    )
+
+
+# submissions go through a queue drained by one writer thread, which groups
+# concurrent submits into a single transaction and amortizes the fsync
+_write_q = queue.Queue()
+
+
+def _writer_loop():
+    # the writer outlives script runs, so it owns a dedicated WAL connection
+    # rather than sharing the cached per-session handle
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    while True:
+        batch = [_write_q.get()]
+        deadline = time.monotonic() + 0.05
+        while time.monotonic() < deadline and len(batch) < 500:
+            try:
+                batch.append(_write_q.get(timeout=0.01))
+            except queue.Empty:
+                break
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT INTO feedback(rating, review, summary, actions, timestamp) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (r["rating"], r["review"], r["summary"], r["actions"], r["timestamp"])
+                    for r in batch
+                ],
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            # a transient failure (e.g. busy timeout) must not kill the
+            # thread and silently drop every later submission: roll back,
+            # re-queue the batch and back off before the next attempt
+            logger.exception("feedback writer batch failed; re-queueing %d records", len(batch))
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            for r in batch:
+                _write_q.put(r)
+            time.sleep(0.5)
+        finally:
+            for _ in batch:
+                _write_q.task_done()
+
+
+@st.cache_resource
+def start_writer():
+    t = threading.Thread(target=_writer_loop, daemon=True, name="feedback-writer")
+    t.start()
+    return t
+
+
+def insert_feedback_sql(record):
+    _write_q.put(record)
+
+
+def flush_writes(timeout=2.0):
+    """Wait until queued submissions are committed; True when drained.
+
+    Same condition Queue.join() waits on, but with a bound so a struggling
+    writer can't hang the submit callback.
+    """
+    with _write_q.all_tasks_done:
+        if _write_q.unfinished_tasks:
+            _write_q.all_tasks_done.wait(timeout)
+        return not _write_q.unfinished_tasks
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_recent_sql(limit=5, v=0):
+    # v is only part of the cache key: handle_submit bumps it after each
+    # insert, so the query runs once per data version instead of per rerun
+    # SUBSTR keeps the preview payload small; full text stays in the table
+    rows = get_conn().execute(
+        "SELECT rating, SUBSTR(review, 1, 200), summary, actions, timestamp "
+        "FROM feedback ORDER BY id DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    return [
+        {"rating": r[0], "review": r[1], "summary": r[2], "actions": r[3], "timestamp": r[4]}
+        for r in rows
+    ]
+
+
+def lookup_llm_cache(key):
+    row = get_conn().execute(
+        "SELECT response, summary, actions FROM llm_cache WHERE key=?", (key,)
+    ).fetchone()
+    if row:
+        return {"response": row[0], "summary": row[1], "actions": row[2]}
+    return None
+
+
+def store_llm_cache(key, ai):
+    with _WRITE_LOCK:
+        get_conn().execute(
+            "INSERT OR REPLACE INTO llm_cache(key, response, summary, actions, created) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, ai.get("response", ""), ai.get("summary", ""), ai.get("actions", ""), time.time()),
+        )
@@ -0,0 +1,138 @@
+"""Semantic cache for AI feedback responses.
+
+Embeds the normalized review text with a local sentence-transformers model
+and reuses the stored {response, summary, actions} for near-duplicate
+reviews, skipping the Gemini round-trip entirely on a hit. Payloads (and
+full-precision embedding blobs) persist in the feedback_cache table of the
+app database; the stacked embeddings additionally live in an append-only
+FP16 sidecar file that is memory-mapped for the cosine search, halving the
+bytes streamed per lookup. The sidecar is rebuilt from the SQLite blobs if
+it goes missing or out of sync.
+"""
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+DB_PATH = "feedback.db"
+EMB_PATH = "embeddings.f16.npy"
+EMBED_MODEL = "all-MiniLM-L6-v2"
+EMBED_DIM = 384
+SIM_THRESHOLD = 0.92
+
+_ROW_BYTES = EMBED_DIM * 2  # float16
+
+
+def _normalize(text):
+    return " ".join(text.lower().split())
+
+
+class SemanticCache:
+    def __init__(self, db_path=DB_PATH, emb_path=EMB_PATH, threshold=SIM_THRESHOLD):
+        self.db_path = db_path
+        self.emb_path = emb_path
+        self.threshold = threshold
+        self._model = None
+        self._lock = threading.Lock()
+        # memmap view over the FP16 sidecar, one L2-normalized row per entry
+        self._mm = None
+        self._payloads = []
+        self._load()
+
+    def available(self):
+        return SentenceTransformer is not None
+
+    def _conn(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS feedback_cache ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "embedding BLOB, response TEXT, summary TEXT, actions TEXT)"
+        )
+        return conn
+
+    def _bind(self, n):
+        # rebind after every append: a memmap's size is fixed at creation
+        self._mm = (
+            np.memmap(self.emb_path, dtype=np.float16, mode="r", shape=(n, EMBED_DIM))
+            if n
+            else None
+        )
+
+    def _load(self):
+        conn = self._conn()
+        try:
+            rows = conn.execute(
+                "SELECT embedding, response, summary, actions FROM feedback_cache ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+        self._payloads = [
+            {"response": r[1], "summary": r[2], "actions": r[3]} for r in rows
+        ]
+        n = len(rows)
+        on_disk = os.path.getsize(self.emb_path) if os.path.exists(self.emb_path) else 0
+        if on_disk != n * _ROW_BYTES:
+            # sidecar missing, stale, or orphaned (e.g. feedback.db was
+            # recreated while the file survived): rewrite it from the fp32
+            # blobs — truncating to empty when the table is empty — so a
+            # leftover file can never misalign rows against new payloads
+            with open(self.emb_path, "wb") as f:
+                for r in rows:
+                    f.write(np.frombuffer(r[0], dtype=np.float32).astype(np.float16).tobytes())
+        self._bind(n)
+
+    def _embed(self, text):
+        if self._model is None:
+            self._model = SentenceTransformer(EMBED_MODEL)
+        vec = self._model.encode([_normalize(text)])[0].astype(np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def lookup(self, review):
+        """Return the cached ai dict for a near-duplicate review, else None."""
+        if not self.available():
+            return None
+        with self._lock:
+            if self._mm is None:
+                return None
+            q = self._embed(review)
+            # single FP16→FP32 GEMV over the mmapped matrix
+            sims = self._mm.astype(np.float32) @ q
+            i = int(sims.argmax())
+            if sims[i] >= self.threshold:
+                return dict(self._payloads[i])
+        return None
+
+    def insert(self, review, ai):
+        if not self.available():
+            return
+        with self._lock:
+            q = self._embed(review)
+            with open(self.emb_path, "ab") as f:
+                f.write(q.astype(np.float16).tobytes())
+            self._payloads.append(
+                {k: ai.get(k, "") for k in ("response", "summary", "actions")}
+            )
+            self._bind(len(self._payloads))
+            conn = self._conn()
+            try:
+                conn.execute(
+                    "INSERT INTO feedback_cache(embedding, response, summary, actions) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        q.tobytes(),
+                        ai.get("response", ""),
+                        ai.get("summary", ""),
+                        ai.get("actions", ""),
+                    ),
+                )
+                conn.commit()
+            finally:
+                conn.close()